@@ -2,15 +2,19 @@ import { highlightMarker } from "./mapControl.js";
 
 export function displayItinerary(parsed, dayStats = []) {
   const itineraryDiv = document.getElementById("itinerary");
-  let html = "";
-  parsed.itinerary.forEach((day, dayIdx) => {
-    const stat = dayStats[dayIdx] || { distance: 0, duration: 0 };
-    html += `
+  const html = parsed.itinerary
+    .map((day, dayIdx) => {
+      // 경로 계산 전(undefined)에는 "계산 중", 계산할 수 없으면(null) "-" 표시
+      const stat = dayStats[dayIdx];
+      const pending = stat === undefined ? "계산 중" : "-";
+      const distance = stat ? `${stat.distance}km` : pending;
+      const duration = stat ? `${stat.duration}분` : pending;
+      return `
       <div class="day-item itinerary-card">
         <div class="day-date">Day ${day.day} - ${day.date} (${day.city})</div>
         <div class="itinerary-meta">
-          <span>이동거리: <b>${stat.distance}km</b></span>
-          <span>예상시간: <b>${stat.duration}분</b></span>
+          <span>이동거리: <b>${distance}</b></span>
+          <span>예상시간: <b>${duration}</b></span>
         </div>
         <div class="itinerary-locations">
           ${day.locations
@@ -28,7 +32,8 @@ export function displayItinerary(parsed, dayStats = []) {
         </div>
       </div>
     `;
-  });
+    })
+    .join("");
   itineraryDiv.innerHTML = html;
   document.getElementById("shareSection").style.display = "block";
 
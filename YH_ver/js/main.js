@@ -28,17 +28,23 @@ async function generatePlan() {
             throw new Error("일정 생성 실패: 파싱 결과가 비어있음");
           }
           currentItinerary = parsed;
-          // 거리/시간 정보는 addMarkersToMap 콜백에서 displayItinerary로 전달
+          // 일정은 바로 표시하고, 거리/시간은 addMarkersToMap 콜백에서 채워 다시 표시
+          displayItinerary(parsed);
           setTimeout(() => {
             try {
               initMap();
               addMarkersToMap(parsed.itinerary, (dayStats) => {
+                // 그 사이 다른 일정으로 바뀌었다면 무시
+                if (currentItinerary !== parsed) return;
                 currentDayStats = dayStats;
                 displayItinerary(parsed, dayStats);
               });
             } catch (mapError) {
               console.warn("지도 처리 중 오류:", mapError);
-              displayItinerary(parsed);
+              // "계산 중" 표시가 남지 않도록 거리/시간을 계산 불가로 다시 표시
+              if (currentItinerary === parsed) {
+                displayItinerary(parsed, parsed.itinerary.map(() => null));
+              }
             }
           }, 100);
           resolve(parsed);
@@ -64,7 +70,10 @@ async function generatePlan() {
         },
       ],
     };
-    displayItinerary(fallbackItinerary);
+    displayItinerary(
+      fallbackItinerary,
+      fallbackItinerary.itinerary.map(() => null)
+    );
     currentItinerary = fallbackItinerary;
     document.getElementById("map").innerHTML = `
       <div style="text-align: center; padding: 50px; color: #666; line-height: 1.6;">
@@ -89,7 +98,8 @@ document.addEventListener("DOMContentLoaded", function () {
   if (travelData) {
     const travelInput = document.getElementById("travelInput");
     if (travelInput) {
-      travelInput.value = decodeURIComponent(travelData);
+      // URLSearchParams.get()이 이미 디코딩한 값을 돌려준다
+      travelInput.value = travelData;
       setTimeout(() => {
         generatePlan();
       }, 1000);
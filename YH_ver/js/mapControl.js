@@ -1,17 +1,36 @@
 let map;
 let markers = [];
-let routeLayers = [];
+let routeControls = [];
+// addMarkersToMap 호출마다 증가, 이전 일정의 늦은 경로 콜백을 무시하는 데 사용
+let routeGeneration = 0;
+let foodIcon = null;
 
 // Leaflet Routing Machine이 필요합니다. (CDN: https://unpkg.com/leaflet-routing-machine@latest/dist/leaflet-routing-machine.js)
 
+// day별 경로 색상
+const ROUTE_COLORS = ["red", "blue", "green", "orange", "violet"];
+
+const MAP_ERROR_HTML =
+  '<div style="text-align: center; padding: 50px; color: #666;">지도 로딩 중 오류가 발생했습니다.<br>간단한 지도 대신 텍스트 기반 결과를 표시합니다.</div>';
+
 export function initMap() {
   try {
     if (typeof L === "undefined") {
       console.error("Leaflet이 로드되지 않았습니다");
-      document.getElementById("map").innerHTML =
-        '<div style="text-align: center; padding: 50px; color: #666;">지도 로딩 중 오류가 발생했습니다.<br>간단한 지도 대신 텍스트 기반 결과를 표시합니다.</div>';
+      document.getElementById("map").innerHTML = MAP_ERROR_HTML;
       return;
     }
+    // 이미 생성된 지도는 재사용 (같은 컨테이너에 L.map을 다시 호출하면 오류 발생)
+    if (map) {
+      if (map.getContainer().contains(map.getPane("mapPane"))) {
+        map.invalidateSize();
+        return;
+      }
+      // 컨테이너 내용이 교체된 경우에만 새로 생성
+      clearMap();
+      map.remove();
+      map = null;
+    }
     map = L.map("map").setView([37.7519, 128.8761], 10);
     L.tileLayer("https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png", {
       attribution: "© OpenStreetMap contributors",
@@ -19,43 +38,73 @@ export function initMap() {
     console.log("지도 초기화 완료");
   } catch (error) {
     console.error("지도 초기화 오류:", error);
-    document.getElementById("map").innerHTML =
-      '<div style="text-align: center; padding: 50px; color: #666;">지도 로딩 중 오류가 발생했습니다.<br>간단한 지도 대신 텍스트 기반 결과를 표시합니다.</div>';
+    document.getElementById("map").innerHTML = MAP_ERROR_HTML;
+  }
+}
+
+// 맛집 마커 아이콘은 한 번만 만들어 모든 마커가 공유
+function getFoodIcon() {
+  if (!foodIcon) {
+    foodIcon = L.icon({
+      iconUrl: "https://cdn-icons-png.flaticon.com/512/1046/1046784.png",
+      iconSize: [32, 32],
+      iconAnchor: [16, 32],
+      popupAnchor: [0, -32],
+    });
   }
+  return foodIcon;
 }
 
 export function clearMap() {
   if (typeof L !== "undefined" && map) {
     markers.forEach((marker) => map.removeLayer(marker));
-    routeLayers.forEach((layer) => map.removeLayer(layer));
+    // Routing Machine 컨트롤은 레이어가 아니므로 removeLayer로는 지워지지 않는다
+    routeControls.forEach((control) => control.remove());
   }
   markers = [];
-  routeLayers = [];
+  routeControls = [];
+  routeGeneration++;
+}
+
+// 거리/시간을 계산할 수 없을 때 day별로 null을 콜백에 전달
+function reportUnavailableStats(itinerary, onRouteStats) {
+  if (typeof onRouteStats === "function") {
+    onRouteStats(itinerary.map(() => null));
+  }
 }
 
 // day별 locations 경로를 지도에 표시하고, 거리/시간 계산 결과를 콜백으로 반환
 export function addMarkersToMap(itinerary, onRouteStats) {
   if (typeof L === "undefined" || !map) {
     console.log("지도를 사용할 수 없어 마커 추가/경로 생성을 건너뜁니다");
+    reportUnavailableStats(itinerary, onRouteStats);
     return;
   }
   try {
     clearMap();
-    const colors = ["red", "blue", "green", "orange", "violet"];
+    const generation = routeGeneration;
     let bounds = [];
     let dayStats = [];
     let routingCount = 0;
+    // day별 경로 계산이 끝날 때마다 호출, 모든 day가 끝나면 콜백으로 전달
+    const reportDayStats = (dayIndex, stats) => {
+      // 새 일정이 그려진 뒤 도착한 이전 일정의 결과는 버린다
+      if (generation !== routeGeneration) return;
+      dayStats[dayIndex] = stats;
+      routingCount++;
+      if (
+        routingCount === itinerary.length &&
+        typeof onRouteStats === "function"
+      ) {
+        onRouteStats(dayStats);
+      }
+    };
     itinerary.forEach((day, dayIndex) => {
       // 마커 추가
       day.locations.forEach((location, locIndex) => {
         let markerOptions = {};
         if (location.type === "food") {
-          markerOptions.icon = L.icon({
-            iconUrl: "https://cdn-icons-png.flaticon.com/512/1046/1046784.png",
-            iconSize: [32, 32],
-            iconAnchor: [16, 32],
-            popupAnchor: [0, -32],
-          });
+          markerOptions.icon = getFoodIcon();
         }
         const marker = L.marker(
           [location.lat, location.lng],
@@ -81,7 +130,7 @@ export function addMarkersToMap(itinerary, onRouteStats) {
           lineOptions: {
             styles: [
               {
-                color: colors[dayIndex % colors.length],
+                color: ROUTE_COLORS[dayIndex % ROUTE_COLORS.length],
                 weight: 5,
                 opacity: 0.7,
               },
@@ -97,7 +146,7 @@ export function addMarkersToMap(itinerary, onRouteStats) {
             serviceUrl: "https://router.project-osrm.org/route/v1",
           }),
         }).addTo(map);
-        routeLayers.push(router);
+        routeControls.push(router);
         // 안내 패널 DOM 숨기기
         router.on("routeselected", function () {
           const container = router._container;
@@ -109,24 +158,15 @@ export function addMarkersToMap(itinerary, onRouteStats) {
           const route = e.routes[0];
           const distance = Math.round(route.summary.totalDistance / 100) / 10; // km
           const duration = Math.round(route.summary.totalTime / 60); // 분
-          dayStats[dayIndex] = { distance, duration };
-          routingCount++;
-          if (
-            routingCount === itinerary.length &&
-            typeof onRouteStats === "function"
-          ) {
-            onRouteStats(dayStats);
-          }
+          reportDayStats(dayIndex, { distance, duration });
+        });
+        // OSRM 서버 오류(요청 제한 등) 시에도 일정은 표시되도록 계산 불가(null)로 처리
+        router.on("routingerror", function (e) {
+          console.warn("경로 계산 오류:", e.error);
+          reportDayStats(dayIndex, null);
         });
       } else {
-        dayStats[dayIndex] = { distance: 0, duration: 0 };
-        routingCount++;
-        if (
-          routingCount === itinerary.length &&
-          typeof onRouteStats === "function"
-        ) {
-          onRouteStats(dayStats);
-        }
+        reportDayStats(dayIndex, { distance: 0, duration: 0 });
       }
     });
     if (bounds.length > 0) {
@@ -135,12 +175,14 @@ export function addMarkersToMap(itinerary, onRouteStats) {
     console.log("마커 및 경로 추가 완료:", markers.length + "개");
   } catch (error) {
     console.error("마커/경로 추가 오류:", error);
+    // 진행 중인 경로 결과는 무시하고 거리/시간을 계산할 수 없음으로 표시
+    routeGeneration++;
+    reportUnavailableStats(itinerary, onRouteStats);
   }
 }
 
 // 마커 강조 함수 (itinerary day/loc 인덱스 기반)
 export function highlightMarker(dayIndex, locIndex) {
-  if (!markers[dayIndex * 10 + locIndex]) return;
   const marker = markers.find(
     (m) => m._dayIndex === dayIndex && m._locIndex === locIndex
   );
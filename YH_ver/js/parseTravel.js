@@ -1,5 +1,20 @@
 import { cities, attractions } from "../data/attractions.js";
 
+// 날짜 패턴 (호출마다 새로 만들지 않도록 모듈 스코프에 둔다)
+const DATE_PATTERN =
+  /(\d{1,2}월?\s*\d{1,2}일?)|(\d{4}-\d{1,2}-\d{1,2})|(\d{1,2}\/\d{1,2})/g;
+
+// 도시 이름 전체를 한 번에 찾는 패턴 (입력을 한 번만 훑는다)
+const CITY_PATTERN = new RegExp(
+  cities.map((c) => c.name.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")).join("|"),
+  "g"
+);
+
+// 날짜를 찾지 못했을 때 쓰는 기본 일정
+const DEFAULT_DATES = ["7월 25일", "7월 26일", "7월 27일", "7월 28일", "7월 29일"];
+// 명소/맛집 데이터가 없는 도시용
+const EMPTY_CITY_DATA = { spots: [], foods: [] };
+
 function getRandomItems(arr, count) {
   const shuffled = arr.slice().sort(() => 0.5 - Math.random());
   return shuffled.slice(0, count);
@@ -9,12 +24,8 @@ export function parseTravel(input) {
   console.log("파싱 시작:", input);
   try {
     // 입력에서 여러 도시 감지
-    let detectedCities = [];
-    for (const city of cities) {
-      if (input.includes(city.name)) {
-        detectedCities.push(city);
-      }
-    }
+    const matchedNames = new Set(input.match(CITY_PATTERN));
+    let detectedCities = cities.filter((city) => matchedNames.has(city.name));
     if (detectedCities.length === 0) {
       detectedCities = [cities[3]]; // 기본값: 강릉
     }
@@ -22,11 +33,9 @@ export function parseTravel(input) {
       "감지된 도시들:",
       detectedCities.map((c) => c.name)
     );
-    const datePattern =
-      /(\d{1,2}월?\s*\d{1,2}일?)|(\d{4}-\d{1,2}-\d{1,2})|(\d{1,2}\/\d{1,2})/g;
-    let dates = input.match(datePattern) || [];
+    let dates = input.match(DATE_PATTERN) || [];
     if (dates.length < 2) {
-      dates = ["7월 25일", "7월 26일", "7월 27일", "7월 28일", "7월 29일"];
+      dates = DEFAULT_DATES;
     }
     console.log("감지된 날짜:", dates);
     const maxDays = Math.min(dates.length, detectedCities.length > 1 ? 5 : 3);
@@ -34,10 +43,7 @@ export function parseTravel(input) {
     for (let i = 0; i < maxDays; i++) {
       const cityIndex = i % detectedCities.length;
       const currentCity = detectedCities[cityIndex];
-      const cityData = attractions[currentCity.name] || {
-        spots: [],
-        foods: [],
-      };
+      const cityData = attractions[currentCity.name] || EMPTY_CITY_DATA;
       // 명소 2~3개, 맛집 1~2개 랜덤 선택
       const numSpots = Math.min(
         cityData.spots.length,
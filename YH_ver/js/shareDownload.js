@@ -1,14 +1,15 @@
 export function shareItinerary(currentItinerary) {
   if (!currentItinerary) return;
-  let shareText = `✈️ AI가 생성한 동해안 여행 계획\n\n`;
+  const lines = ["✈️ AI가 생성한 동해안 여행 계획", ""];
   currentItinerary.itinerary.forEach((day) => {
-    shareText += `📅 Day ${day.day} - ${day.date} (${day.city})\n`;
+    lines.push(`📅 Day ${day.day} - ${day.date} (${day.city})`);
     day.locations.forEach((loc) => {
-      shareText += `  ${loc.time} - ${loc.name}\n`;
+      lines.push(`  ${loc.time} - ${loc.name}`);
     });
-    shareText += "\n";
+    lines.push("");
   });
-  shareText += "🚀 TripAI에서 생성됨";
+  lines.push("🚀 TripAI에서 생성됨");
+  const shareText = lines.join("\n");
   if (navigator.share) {
     navigator.share({
       title: "AI 여행 계획",